@@ -102,12 +102,13 @@ async def list_credentials(
         else:
             credentials = await Credential.get_all(order_by="provider, created")
 
-        result = []
-        for cred in credentials:
-            models = await cred.get_linked_models()
-            result.append(credential_to_response(cred, len(models)))
-
-        return result
+        counts = await Credential.get_linked_model_counts(
+            [cred.id for cred in credentials if cred.id]
+        )
+        return [
+            credential_to_response(cred, counts.get(cred.id or "", 0))
+            for cred in credentials
+        ]
 
     except Exception as e:
         logger.error(f"Error listing credentials: {e}")
@@ -119,11 +120,13 @@ async def list_credentials_by_provider(provider: str):
     """List all credentials for a specific provider."""
     try:
         credentials = await Credential.get_by_provider(provider.lower())
-        result = []
-        for cred in credentials:
-            models = await cred.get_linked_models()
-            result.append(credential_to_response(cred, len(models)))
-        return result
+        counts = await Credential.get_linked_model_counts(
+            [cred.id for cred in credentials if cred.id]
+        )
+        return [
+            credential_to_response(cred, counts.get(cred.id or "", 0))
+            for cred in credentials
+        ]
     except Exception as e:
         logger.error(f"Error listing credentials for {provider}: {e}")
         raise HTTPException(status_code=500, detail="Failed to list credentials for provider")
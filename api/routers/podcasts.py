@@ -241,11 +241,10 @@ async def retry_podcast_episode(episode_id: str):
         # Delete audio file if any
         if episode.audio_file:
             audio_path = _resolve_audio_path(episode.audio_file)
-            if audio_path.exists():
-                try:
-                    audio_path.unlink()
-                except Exception as e:
-                    logger.warning(f"Failed to delete audio file {audio_path}: {e}")
+            try:
+                audio_path.unlink(missing_ok=True)
+            except Exception as e:
+                logger.warning(f"Failed to delete audio file {audio_path}: {e}")
 
         # Delete the failed episode
         await episode.delete()
@@ -279,12 +278,13 @@ async def delete_podcast_episode(episode_id: str):
         # Delete the physical audio file if it exists
         if episode.audio_file:
             audio_path = _resolve_audio_path(episode.audio_file)
-            if audio_path.exists():
-                try:
-                    audio_path.unlink()
-                    logger.info(f"Deleted audio file: {audio_path}")
-                except Exception as e:
-                    logger.warning(f"Failed to delete audio file {audio_path}: {e}")
+            try:
+                audio_path.unlink()
+                logger.info(f"Deleted audio file: {audio_path}")
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning(f"Failed to delete audio file {audio_path}: {e}")
 
         # Delete the episode from the database
         await episode.delete()
@@ -1,7 +1,10 @@
 import asyncio
+import functools
+import json
 import os
+import shutil
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, BinaryIO, List, Optional
 
 from fastapi import (
     APIRouter,
@@ -37,11 +40,21 @@ from open_notebook.exceptions import InvalidInputError
 
 router = APIRouter()
 
+# Buffer size for copying uploads that can't be copied fd-to-fd
+UPLOAD_COPY_CHUNK_SIZE = 1024 * 1024
+
+
+@functools.lru_cache(maxsize=64)
+def _ensure_upload_dir(upload_folder: str) -> Path:
+    """Create the upload folder once per process instead of on every upload."""
+    path = Path(upload_folder)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
 
 def generate_unique_filename(original_filename: str, upload_folder: str) -> str:
     """Generate unique filename like Streamlit app (append counter if file exists)."""
-    file_path = Path(upload_folder)
-    file_path.mkdir(parents=True, exist_ok=True)
+    file_path = _ensure_upload_dir(upload_folder)
 
     # Split filename and extension
     stem = Path(original_filename).stem
@@ -61,6 +74,25 @@ def generate_unique_filename(original_filename: str, upload_folder: str) -> str:
         counter += 1
 
 
+def _copy_upload_to_disk(source: BinaryIO, file_path: str) -> None:
+    """Copy an upload's spooled file to disk in chunks (never fully in memory)."""
+    with open(file_path, "wb") as f:
+        # Large uploads have already rolled over to a temp file on disk; let
+        # the kernel copy those fd-to-fd instead of through Python buffers.
+        # getattr mirrors Starlette's own check on SpooledTemporaryFile.
+        if getattr(source, "_rolled", False) and hasattr(os, "copy_file_range"):
+            try:
+                while os.copy_file_range(source.fileno(), f.fileno(), 2**30):
+                    pass
+                return
+            except OSError as e:
+                logger.debug(f"copy_file_range unavailable ({e}), copying in chunks")
+                source.seek(0)
+                f.seek(0)
+                f.truncate()
+        shutil.copyfileobj(source, f, UPLOAD_COPY_CHUNK_SIZE)
+
+
 async def save_uploaded_file(upload_file: UploadFile) -> str:
     """Save uploaded file to uploads folder and return file path."""
     if not upload_file.filename:
@@ -70,18 +102,23 @@ async def save_uploaded_file(upload_file: UploadFile) -> str:
     file_path = generate_unique_filename(upload_file.filename, UPLOADS_FOLDER)
 
     try:
-        # Save file
-        with open(file_path, "wb") as f:
-            content = await upload_file.read()
-            f.write(content)
+        # Stream to disk off the event loop
+        await upload_file.seek(0)
+        try:
+            await asyncio.to_thread(_copy_upload_to_disk, upload_file.file, file_path)
+        except FileNotFoundError:
+            # The cached upload folder was removed while running - recreate it
+            _ensure_upload_dir.cache_clear()
+            file_path = generate_unique_filename(upload_file.filename, UPLOADS_FOLDER)
+            await upload_file.seek(0)
+            await asyncio.to_thread(_copy_upload_to_disk, upload_file.file, file_path)
 
         logger.info(f"Saved uploaded file to: {file_path}")
         return file_path
     except Exception as e:
         logger.error(f"Failed to save uploaded file: {e}")
         # Clean up partial file if it exists
-        if os.path.exists(file_path):
-            os.unlink(file_path)
+        Path(file_path).unlink(missing_ok=True)
         raise
 
 
@@ -99,7 +136,6 @@ def parse_source_form_data(
     file: Optional[UploadFile] = File(None),
 ) -> tuple[SourceCreate, Optional[UploadFile]]:
     """Parse form data into SourceCreate model and return upload file separately."""
-    import json
 
     # Convert string booleans to actual booleans
     def str_to_bool(value: str) -> bool:
@@ -366,9 +402,6 @@ async def create_source(
                 await source.add_to_notebook(notebook_id)
 
             try:
-                # Import command modules to ensure they're registered
-                import commands.source_commands  # noqa: F401
-
                 # Submit command for background processing
                 command_input = SourceProcessingInput(
                     source_id=str(source.id),
@@ -429,9 +462,6 @@ async def create_source(
             logger.info("Using sync processing path")
 
             try:
-                # Import command modules to ensure they're registered
-                import commands.source_commands  # noqa: F401
-
                 # Create source record - let SurrealDB generate the ID
                 source = Source(
                     title=source_data.title or "Processing...",
@@ -850,9 +880,6 @@ async def retry_source_processing(source_id: str):
                 )
 
         try:
-            # Import command modules to ensure they're registered
-            import commands.source_commands  # noqa: F401
-
             # Submit new command for background processing
             command_input = SourceProcessingInput(
                 source_id=str(source.id),
@@ -10,7 +10,11 @@ from open_notebook.database.repository import ensure_record_id, repo_insert, rep
 from open_notebook.exceptions import ConfigurationError
 from open_notebook.domain.notebook import Note, Source, SourceInsight
 from open_notebook.utils.chunking import ContentType, chunk_text, detect_content_type
-from open_notebook.utils.embedding import generate_embedding, generate_embeddings
+from open_notebook.utils.embedding import (
+    embedding_hash,
+    generate_embedding,
+    generate_embeddings,
+)
 
 
 def full_model_dump(model):
@@ -329,7 +333,7 @@ async def embed_source_command(input_data: EmbedSourceInput) -> EmbedSourceOutpu
     3. Detect content type from file path or content
     4. Chunk text using appropriate splitter
     5. Generate embeddings for all chunks in batches
-    6. Bulk INSERT source_embedding records
+    6. Bulk INSERT source_embedding records and update source.chunk_count/embedded_hash
 
     Retry Strategy:
     - Retries up to 5 times for transient failures (network, timeout, etc.)
@@ -355,6 +359,10 @@ async def embed_source_command(input_data: EmbedSourceInput) -> EmbedSourceOutpu
             "DELETE source_embedding WHERE source = $source_id",
             {"source_id": ensure_record_id(input_data.source_id)},
         )
+        await repo_query(
+            "UPDATE $source_id SET chunk_count = 0, embedded_hash = NONE",
+            {"source_id": ensure_record_id(input_data.source_id)},
+        )
 
         # 3. Detect content type from file path if available
         file_path = source.asset.file_path if source.asset else None
@@ -377,7 +385,9 @@ async def embed_source_command(input_data: EmbedSourceInput) -> EmbedSourceOutpu
         if total_chunks == 0:
             raise ValueError("No chunks created after splitting text")
 
-        # 5. Generate embeddings for all chunks in batches
+        # 5. Generate embeddings for all chunks in batches. Fingerprint first so
+        # a model switch mid-run leaves a stale hash and forces a re-embed.
+        source_hash = await embedding_hash(source.full_text)
         cmd_id = get_command_id(input_data)
         logger.debug(f"Generating embeddings for {total_chunks} chunks")
         embeddings = await generate_embeddings(chunks, command_id=cmd_id)
@@ -402,6 +412,14 @@ async def embed_source_command(input_data: EmbedSourceInput) -> EmbedSourceOutpu
 
         logger.debug(f"Inserting {len(records)} source_embedding records")
         await repo_insert("source_embedding", records)
+        await repo_query(
+            "UPDATE $source_id SET chunk_count = $chunk_count, embedded_hash = $embedded_hash",
+            {
+                "source_id": ensure_record_id(input_data.source_id),
+                "chunk_count": total_chunks,
+                "embedded_hash": source_hash,
+            },
+        )
 
         processing_time = time.time() - start_time
         logger.info(
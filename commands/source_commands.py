@@ -1,3 +1,4 @@
+import asyncio
 import time
 from typing import Any, Dict, List, Optional
 
@@ -72,14 +73,16 @@ async def process_source_command(
         logger.info(f"Transformations: {input_data.transformations}")
         logger.info(f"Embed: {input_data.embed}")
 
-        # 1. Load transformation objects from IDs
-        transformations = []
-        for trans_id in input_data.transformations:
-            logger.info(f"Loading transformation: {trans_id}")
-            transformation = await Transformation.get(trans_id)
+        # 1. Load transformation objects from IDs (concurrently)
+        logger.info(f"Loading transformations: {input_data.transformations}")
+        transformations = await asyncio.gather(
+            *(Transformation.get(trans_id) for trans_id in input_data.transformations)
+        )
+        for trans_id, transformation in zip(
+            input_data.transformations, transformations
+        ):
             if not transformation:
                 raise ValueError(f"Transformation '{trans_id}' not found")
-            transformations.append(transformation)
 
         logger.info(f"Loaded {len(transformations)} transformations")
 
@@ -109,6 +112,7 @@ async def process_source_command(
                 "apply_transformations": transformations,
                 "embed": input_data.embed,
                 "source_id": input_data.source_id,  # Add the source_id to the state
+                "source": source,  # Already loaded; save_source reuses it
             }
         )
 
@@ -1,4 +1,5 @@
-from typing import Any, ClassVar, Dict, Optional, Union
+import time
+from typing import Any, ClassVar, Dict, Optional, Tuple, Union
 
 from esperanto import (
     AIFactory,
@@ -9,12 +10,20 @@ from esperanto import (
 )
 from loguru import logger
 
+from open_notebook.ai.key_provider import provision_provider_keys
 from open_notebook.database.repository import ensure_record_id, repo_query
 from open_notebook.domain.base import ObjectModel, RecordModel
+from open_notebook.domain.credential import Credential
 from open_notebook.exceptions import ConfigurationError
 
 ModelType = Union[LanguageModel, EmbeddingModel, SpeechToTextModel, TextToSpeechModel]
 
+# Model records by id. get_model() runs on every provisioning (each chat turn,
+# transformation and embedding batch); entries expire so edits made by another
+# process (API vs. worker) are picked up within the TTL.
+MODEL_CACHE_TTL = 60.0
+_model_cache: Dict[str, Tuple[float, "Model"]] = {}
+
 
 class Model(ObjectModel):
     table_name: ClassVar[str] = "model"
@@ -24,6 +33,35 @@ class Model(ObjectModel):
     type: str
     credential: Optional[str] = None
 
+    @classmethod
+    async def get(cls, id: str) -> "Model":
+        """Override get() to serve recently loaded models from the cache."""
+        cached = _model_cache.get(id)
+        if cached and cached[0] > time.monotonic():
+            return cached[1].model_copy()
+
+        instance = await super().get(id)
+        _model_cache[id] = (time.monotonic() + MODEL_CACHE_TTL, instance.model_copy())
+        return instance
+
+    @classmethod
+    def invalidate_cache(cls, id: Optional[str] = None) -> None:
+        """Drop one cached model, or all of them when no id is given."""
+        if id is None:
+            _model_cache.clear()
+        else:
+            _model_cache.pop(id, None)
+
+    async def save(self) -> None:
+        """Save model and drop any stale cached copy."""
+        await super().save()
+        self.invalidate_cache(self.id)
+
+    async def delete(self) -> bool:
+        """Delete model and drop it from the cache."""
+        self.invalidate_cache(self.id)
+        return await super().delete()
+
     @classmethod
     async def get_models_by_type(cls, model_type):
         models = await repo_query(
@@ -50,12 +88,12 @@ class Model(ObjectModel):
         """Get the Credential object linked to this model, if any."""
         if not self.credential:
             return None
-        from open_notebook.domain.credential import Credential
-
         try:
             return await Credential.get(self.credential)
         except Exception:
-            logger.warning(f"Could not load credential {self.credential} for model {self.id}")
+            logger.warning(
+                f"Could not load credential {self.credential} for model {self.id}"
+            )
             return None
 
 
@@ -132,13 +170,9 @@ class ModelManager:
                     f"Falling back to env vars."
                 )
                 # Fall back to env var provisioning
-                from open_notebook.ai.key_provider import provision_provider_keys
-
                 await provision_provider_keys(model.provider)
         else:
             # No credential linked - use env var fallback
-            from open_notebook.ai.key_provider import provision_provider_keys
-
             await provision_provider_keys(model.provider)
 
         # Merge any additional kwargs (e.g. temperature)
@@ -1,4 +1,4 @@
-import asyncio
+from open_notebook.utils.async_utils import run_sync
 
 from .async_migrate import AsyncMigrationManager
 
@@ -14,13 +14,13 @@ class MigrationManager:
 
     def get_current_version(self) -> int:
         """Get current database version (sync wrapper)."""
-        return asyncio.run(self._async_manager.get_current_version())
+        return run_sync(self._async_manager.get_current_version())
 
     @property
     def needs_migration(self) -> bool:
         """Check if migration is needed (sync wrapper)."""
-        return asyncio.run(self._async_manager.needs_migration())
+        return run_sync(self._async_manager.needs_migration())
 
     def run_migration_up(self):
         """Run migrations (sync wrapper)."""
-        asyncio.run(self._async_manager.run_migration_up())
+        run_sync(self._async_manager.run_migration_up())
@@ -1,10 +1,12 @@
+import asyncio
 import os
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, TypeVar, Union
+from typing import Any, Dict, List, Optional, Tuple, TypeVar, Union
 
 from loguru import logger
 from surrealdb import AsyncSurreal, RecordID  # type: ignore
+from websockets.exceptions import WebSocketException
 
 T = TypeVar("T", Dict[str, Any], List[Dict[str, Any]])
 
@@ -26,12 +28,27 @@ def get_database_password():
     return os.getenv("SURREAL_PASSWORD") or os.getenv("SURREAL_PASS")
 
 
+_NESTED_TYPES = (dict, list, RecordID)
+
+
 def parse_record_ids(obj: Any) -> Any:
-    """Recursively parse and convert RecordIDs into strings."""
+    """
+    Recursively parse and convert RecordIDs into strings.
+
+    Containers are updated in place (they come straight from the driver) and
+    scalars are skipped without a call, so large rows such as embedding
+    vectors are not copied element by element.
+    """
     if isinstance(obj, dict):
-        return {k: parse_record_ids(v) for k, v in obj.items()}
+        for k, v in obj.items():
+            if isinstance(v, _NESTED_TYPES):
+                obj[k] = parse_record_ids(v)
+        return obj
     elif isinstance(obj, list):
-        return [parse_record_ids(item) for item in obj]
+        for i, item in enumerate(obj):
+            if isinstance(item, _NESTED_TYPES):
+                obj[i] = parse_record_ids(item)
+        return obj
     elif isinstance(obj, RecordID):
         return str(obj)
     return obj
@@ -44,8 +61,17 @@ def ensure_record_id(value: Union[str, RecordID]) -> RecordID:
     return RecordID.parse(value)
 
 
-@asynccontextmanager
-async def db_connection():
+# One authenticated connection per event loop, reused across repository calls.
+# The websocket client multiplexes concurrent requests by id, so sharing it
+# avoids a connect + signin + use handshake on every query.
+# The client holds its loop strongly, so entries are removed explicitly: each
+# loop gets a keeper task that closes the connection when the loop cancels
+# its remaining tasks on shutdown (asyncio.run, uvicorn, the worker).
+_connections: Dict[asyncio.AbstractEventLoop, AsyncSurreal] = {}
+_loop_state: Dict[asyncio.AbstractEventLoop, Tuple[asyncio.Lock, asyncio.Task]] = {}
+
+
+async def _open_connection() -> AsyncSurreal:
     db = AsyncSurreal(get_database_url())
     await db.signin(
         {
@@ -56,10 +82,79 @@ async def db_connection():
     await db.use(
         os.environ.get("SURREAL_NAMESPACE"), os.environ.get("SURREAL_DATABASE")
     )
+    return db
+
+
+async def _discard_connection(loop: asyncio.AbstractEventLoop, db: AsyncSurreal):
+    """Drop a cached connection so the next call reconnects."""
+    if _connections.get(loop) is db:
+        del _connections[loop]
     try:
-        yield db
-    finally:
         await db.close()
+    except Exception:
+        pass
+
+
+async def _close_on_loop_shutdown(loop: asyncio.AbstractEventLoop) -> None:
+    """Wait until the loop shuts down, then close its cached connection."""
+    try:
+        await loop.create_future()
+    finally:
+        _loop_state.pop(loop, None)
+        db = _connections.get(loop)
+        if db is not None:
+            await _discard_connection(loop, db)
+
+
+def _is_alive(db: AsyncSurreal) -> bool:
+    """Check that a websocket connection's receive loop is still running.
+
+    After a server restart the client keeps its socket but the receive task
+    has exited, so every later query would fail with ConnectionClosed.
+    HTTP connections have no receive task and are always considered alive.
+    """
+    if not hasattr(db, "recv_task"):
+        return True
+    return db.recv_task is not None and not db.recv_task.done()
+
+
+def _get_loop_lock(loop: asyncio.AbstractEventLoop) -> asyncio.Lock:
+    state = _loop_state.get(loop)
+    if state is None:
+        keeper = loop.create_task(_close_on_loop_shutdown(loop))
+        state = _loop_state[loop] = (asyncio.Lock(), keeper)
+    return state[0]
+
+
+@asynccontextmanager
+async def db_connection():
+    loop = asyncio.get_running_loop()
+    db = _connections.get(loop)
+    if db is None or not _is_alive(db):
+        async with _get_loop_lock(loop):
+            db = _connections.get(loop)
+            if db is not None and not _is_alive(db):
+                await _discard_connection(loop, db)
+                db = None
+            if db is None:
+                db = await _open_connection()
+                _connections[loop] = db
+    try:
+        yield db
+    except (OSError, WebSocketException):
+        # The socket is gone (server restart, network drop) - reconnect next time.
+        # Query errors and cancellation leave the connection usable: closing it
+        # would abort every other in-flight query on this loop.
+        await _discard_connection(loop, db)
+        raise
+
+
+async def close_db_connection() -> None:
+    """Close the connection cached for the running event loop, if any."""
+    loop = asyncio.get_running_loop()
+    db = _connections.get(loop)
+    if db is not None:
+        await _discard_connection(loop, db)
 
 
 async def repo_query(
@@ -291,21 +291,18 @@ class RecordModel(BaseModel):
         # Get all non-ClassVar fields and their values
         data = {
             field_name: getattr(self, field_name)
-            for field_name, field_info in self.model_fields.items()
+            for field_name, field_info in type(self).model_fields.items()
             if not str(field_info.annotation).startswith("typing.ClassVar")
         }
 
-        await repo_upsert(
+        # UPSERT returns the stored record, so no follow-up SELECT is needed
+        result = await repo_upsert(
             self.__class__.table_name
             if hasattr(self.__class__, "table_name")
             else "record",
             self.record_id,
             data,
         )
-
-        result = await repo_query(
-            "SELECT * FROM $record_id", {"record_id": ensure_record_id(self.record_id)}
-        )
         if result:
             for key, value in result[0].items():
                 if hasattr(self, key):
@@ -15,15 +15,26 @@ Usage:
     await cred.save()
 """
 
+import time
 from datetime import datetime
-from typing import Any, ClassVar, Dict, List, Optional
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
 
 from loguru import logger
 from pydantic import SecretStr
 
 from open_notebook.database.repository import ensure_record_id, repo_query
 from open_notebook.domain.base import ObjectModel
-from open_notebook.utils.encryption import decrypt_value, encrypt_value
+from open_notebook.utils.encryption import (
+    decrypt_value,
+    decrypt_values,
+    encrypt_value,
+)
+
+# Decrypted credentials by id. Model provisioning loads the linked credential
+# on every get_model() call; entries expire so edits made by another process
+# (API vs. worker) are picked up within the TTL.
+CREDENTIAL_CACHE_TTL = 60.0
+_credential_cache: Dict[str, Tuple[float, "Credential"]] = {}
 
 
 class Credential(ObjectModel):
@@ -114,7 +125,11 @@ class Credential(ObjectModel):
 
     @classmethod
     async def get(cls, id: str) -> "Credential":
-        """Override get() to handle api_key decryption."""
+        """Override get() to handle api_key decryption and caching."""
+        cached = _credential_cache.get(id)
+        if cached and cached[0] > time.monotonic():
+            return cached[1].model_copy(deep=True)
+
         instance = await super().get(id)
         # Pydantic auto-wraps the raw DB string in SecretStr, so we need
         # to extract, decrypt, and re-wrap regardless of type.
@@ -126,21 +141,33 @@ class Credential(ObjectModel):
             )
             decrypted = decrypt_value(raw)
             object.__setattr__(instance, "api_key", SecretStr(decrypted))
+        _credential_cache[id] = (
+            time.monotonic() + CREDENTIAL_CACHE_TTL,
+            instance.model_copy(deep=True),
+        )
         return instance
 
+    @classmethod
+    def invalidate_cache(cls, id: Optional[str] = None) -> None:
+        """Drop one cached credential, or all of them when no id is given."""
+        if id is None:
+            _credential_cache.clear()
+        else:
+            _credential_cache.pop(id, None)
+
     @classmethod
     async def get_all(cls, order_by=None) -> List["Credential"]:
         """Override get_all() to handle api_key decryption."""
         instances = await super().get_all(order_by=order_by)
-        for instance in instances:
-            if instance.api_key:
-                raw = (
-                    instance.api_key.get_secret_value()
-                    if isinstance(instance.api_key, SecretStr)
-                    else instance.api_key
-                )
-                decrypted = decrypt_value(raw)
-                object.__setattr__(instance, "api_key", SecretStr(decrypted))
+        with_key = [instance for instance in instances if instance.api_key]
+        raw_keys = [
+            instance.api_key.get_secret_value()
+            if isinstance(instance.api_key, SecretStr)
+            else instance.api_key
+            for instance in with_key
+        ]
+        for instance, decrypted in zip(with_key, decrypt_values(raw_keys)):
+            object.__setattr__(instance, "api_key", SecretStr(decrypted))
         return instances
 
     async def get_linked_models(self) -> list:
@@ -155,6 +182,17 @@ class Credential(ObjectModel):
         )
         return [Model(**row) for row in results]
 
+    @classmethod
+    async def get_linked_model_counts(cls, credential_ids: List[str]) -> Dict[str, int]:
+        """Count linked models for many credentials in a single query."""
+        if not credential_ids:
+            return {}
+        results = await repo_query(
+            "SELECT credential, count() AS count FROM model WHERE credential IN $cred_ids GROUP BY credential",
+            {"cred_ids": [ensure_record_id(cid) for cid in credential_ids]},
+        )
+        return {str(row["credential"]): row["count"] for row in results}
+
     def _prepare_save_data(self) -> Dict[str, Any]:
         """Override to encrypt api_key before storage."""
         data = {}
@@ -177,6 +215,7 @@ class Credential(ObjectModel):
         original_api_key = self.api_key
 
         await super().save()
+        self.invalidate_cache(self.id)
 
         # After save, the api_key field may be set to the encrypted string
         # from the DB result. Restore the original SecretStr.
@@ -187,6 +226,11 @@ class Credential(ObjectModel):
             decrypted = decrypt_value(self.api_key)
             object.__setattr__(self, "api_key", SecretStr(decrypted))
 
+    async def delete(self) -> bool:
+        """Delete credential and drop it from the cache."""
+        self.invalidate_cache(self.id)
+        return await super().delete()
+
     @classmethod
     def _from_db_row(cls, row: dict) -> "Credential":
         """Create a Credential from a database row, decrypting api_key."""
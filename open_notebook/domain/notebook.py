@@ -274,9 +274,16 @@ class SourceInsight(ObjectModel):
             raise DatabaseOperationError(e)
 
     async def save_as_note(self, notebook_id: Optional[str] = None) -> Any:
-        source = await self.get_source()
+        # Only the title is needed, so skip fetching and parsing the full source
+        result = await repo_query(
+            "SELECT source.title AS title FROM $id",
+            {"id": ensure_record_id(self.id)},
+        )
+        if not result:
+            raise DatabaseOperationError(f"Insight {self.id} not found")
+        source_title = result[0].get("title") or "Untitled Source"
         note = Note(
-            title=f"{self.insight_type} from source {source.title}",
+            title=f"{self.insight_type} from source {source_title}",
             content=self.content,
         )
         await note.save()
@@ -296,23 +303,22 @@ class Source(ObjectModel):
     command: Optional[Union[str, RecordID]] = Field(
         default=None, description="Link to surreal-commands processing job"
     )
+    chunk_count: Optional[int] = Field(
+        default=None,
+        description="Embedded chunk count, maintained by the embed_source command",
+    )
+    embedded_hash: Optional[str] = Field(
+        default=None,
+        description=(
+            "Hash of full_text and embedding model at the last embed, "
+            "maintained by embed_source"
+        ),
+    )
 
-    @field_validator("command", mode="before")
-    @classmethod
-    def parse_command(cls, value):
-        """Parse command field to ensure RecordID format"""
-        if isinstance(value, str) and value:
-            return ensure_record_id(value)
-        return value
-
-    @field_validator("id", mode="before")
+    @field_validator("id", mode="plain")
     @classmethod
     def parse_id(cls, value):
         """Parse id field to handle both string and RecordID inputs"""
-        if value is None:
-            return None
-        if isinstance(value, RecordID):
-            return str(value)
         return str(value) if value else None
 
     async def get_status(self) -> Optional[str]:
@@ -374,6 +380,10 @@ class Source(ObjectModel):
             return dict(id=self.id, title=self.title, insights=insights)
 
     async def get_embedded_chunks(self) -> int:
+        # Use the cached counter when present; sources embedded before it
+        # existed fall back to counting source_embedding rows
+        if self.chunk_count is not None:
+            return self.chunk_count
         try:
             result = await repo_query(
                 """
@@ -426,33 +436,31 @@ class Source(ObjectModel):
             ValueError: If source has no text to vectorize
             DatabaseOperationError: If job submission fails
         """
+        if not self.full_text or not self.full_text.strip():
+            raise ValueError(f"Source {self.id} has no text to vectorize")
+
         logger.info(f"Submitting embed_source job for source {self.id}")
 
         try:
-            if not self.full_text or not self.full_text.strip():
-                raise ValueError(f"Source {self.id} has no text to vectorize")
-
-            # Submit the embed_source command
-            command_id = submit_command(
-                "open_notebook",
-                "embed_source",
-                {"source_id": str(self.id)},
+            # Submit the embed_source command (id is already a string, see parse_id)
+            command_id = str(
+                submit_command(
+                    "open_notebook",
+                    "embed_source",
+                    {"source_id": self.id},
+                )
             )
-
-            command_id_str = str(command_id)
             logger.info(
                 f"Embed source job submitted for source {self.id}: "
-                f"command_id={command_id_str}"
+                f"command_id={command_id}"
             )
 
-            return command_id_str
+            return command_id
 
         except ValueError:
             raise
         except Exception as e:
-            logger.error(
-                f"Failed to submit embed_source job for source {self.id}: {e}"
-            )
+            logger.error(f"Failed to submit embed_source job for source {self.id}: {e}")
             logger.exception(e)
             raise DatabaseOperationError(e)
 
@@ -511,6 +519,10 @@ class Source(ObjectModel):
         if data.get("command") is not None:
             data["command"] = ensure_record_id(data["command"])
 
+        # Embedding bookkeeping is owned by embed_source; never write back a stale copy
+        data.pop("chunk_count", None)
+        data.pop("embedded_hash", None)
+
         return data
 
     async def delete(self) -> bool:
@@ -518,19 +530,18 @@ class Source(ObjectModel):
         # Clean up uploaded file if it exists
         if self.asset and self.asset.file_path:
             file_path = Path(self.asset.file_path)
-            if file_path.exists():
-                try:
-                    os.unlink(file_path)
-                    logger.info(f"Deleted file for source {self.id}: {file_path}")
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to delete file {file_path} for source {self.id}: {e}. "
-                        "Continuing with database deletion."
-                    )
-            else:
+            try:
+                os.unlink(file_path)
+                logger.info(f"Deleted file for source {self.id}: {file_path}")
+            except FileNotFoundError:
                 logger.debug(
                     f"File {file_path} not found for source {self.id}, skipping cleanup"
                 )
+            except Exception as e:
+                logger.warning(
+                    f"Failed to delete file {file_path} for source {self.id}: {e}. "
+                    "Continuing with database deletion."
+                )
 
         # Delete associated embeddings and insights to prevent orphaned records
         try:
@@ -632,6 +643,9 @@ async def text_search(
 ):
     if not keyword:
         raise InvalidInputError("Search keyword cannot be empty")
+    # fn::text_search already merges both kinds in one call; nothing to ask for
+    if not source and not note:
+        return []
     try:
         search_results = await repo_query(
             """
@@ -656,6 +670,9 @@ async def vector_search(
 ):
     if not keyword:
         raise InvalidInputError("Search keyword cannot be empty")
+    # Skip the query embedding and the round-trip when no kind is requested
+    if not source and not note:
+        return []
     try:
         from open_notebook.utils.embedding import generate_embedding
 
@@ -1,5 +1,6 @@
 import operator
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
 from content_core import extract_content
 from content_core.common import ProcessSourceState
@@ -9,11 +10,26 @@ from langgraph.types import Send
 from loguru import logger
 from typing_extensions import Annotated, TypedDict
 
-from open_notebook.ai.models import Model, ModelManager
-from open_notebook.domain.content_settings import ContentSettings
+from open_notebook.ai.models import Model, model_manager
 from open_notebook.domain.notebook import Asset, Source
 from open_notebook.domain.transformation import Transformation
 from open_notebook.graphs.transformation import graph as transform_graph
+from open_notebook.utils.embedding import embedding_hash
+
+# Extraction engines handed to content-core. These are fixed here rather than
+# read from ContentSettings: constructing ContentSettings mutates the shared
+# singleton, and "auto" lets content-core pick the best engine per source.
+DEFAULT_URL_ENGINE = "auto"
+DEFAULT_DOCUMENT_ENGINE = "auto"
+
+# Upper bound on transformations run against one source at the same time
+MAX_CONCURRENT_TRANSFORMATIONS = 5
+
+# Resolved (provider, name) of the default speech-to-text model. Looking it up
+# costs two queries per source; entries expire so changes made in Settings
+# (from the API process) are picked up within the TTL.
+STT_CONFIG_CACHE_TTL = 60.0
+_stt_config_cache: Optional[Tuple[float, Optional[Tuple[str, str]]]] = None
 
 
 class SourceState(TypedDict):
@@ -31,46 +47,36 @@ class TransformationState(TypedDict):
     transformation: Transformation
 
 
+async def _get_stt_config() -> Optional[Tuple[str, str]]:
+    """Get the default speech-to-text (provider, model name), cached with a TTL."""
+    global _stt_config_cache
+    if _stt_config_cache and _stt_config_cache[0] > time.monotonic():
+        return _stt_config_cache[1]
+
+    stt_config = None
+    defaults = await model_manager.get_defaults()
+    if defaults.default_speech_to_text_model:
+        stt_model = await Model.get(defaults.default_speech_to_text_model)
+        if stt_model:
+            stt_config = (stt_model.provider, stt_model.name)
+
+    _stt_config_cache = (time.monotonic() + STT_CONFIG_CACHE_TTL, stt_config)
+    return stt_config
+
+
 async def content_process(state: SourceState) -> dict:
-    content_settings = ContentSettings(
-        default_content_processing_engine_doc="auto",
-        default_content_processing_engine_url="auto",
-        default_embedding_option="ask",
-        auto_delete_files="yes",
-        youtube_preferred_languages=[
-            "en",
-            "pt",
-            "es",
-            "de",
-            "nl",
-            "en-GB",
-            "fr",
-            "hi",
-            "ja",
-        ],
-    )
     content_state: Dict[str, Any] = state["content_state"]  # type: ignore[assignment]
 
-    content_state["url_engine"] = (
-        content_settings.default_content_processing_engine_url or "auto"
-    )
-    content_state["document_engine"] = (
-        content_settings.default_content_processing_engine_doc or "auto"
-    )
+    content_state["url_engine"] = DEFAULT_URL_ENGINE
+    content_state["document_engine"] = DEFAULT_DOCUMENT_ENGINE
     content_state["output_format"] = "markdown"
 
     # Add speech-to-text model configuration from Default Models
     try:
-        model_manager = ModelManager()
-        defaults = await model_manager.get_defaults()
-        if defaults.default_speech_to_text_model:
-            stt_model = await Model.get(defaults.default_speech_to_text_model)
-            if stt_model:
-                content_state["audio_provider"] = stt_model.provider
-                content_state["audio_model"] = stt_model.name
-                logger.debug(
-                    f"Using speech-to-text model: {stt_model.provider}/{stt_model.name}"
-                )
+        stt_config = await _get_stt_config()
+        if stt_config:
+            content_state["audio_provider"], content_state["audio_model"] = stt_config
+            logger.debug(f"Using speech-to-text model: {stt_config[0]}/{stt_config[1]}")
     except Exception as e:
         logger.warning(f"Failed to retrieve speech-to-text model configuration: {e}")
         # Continue without custom audio model (content-core will use its default)
@@ -97,8 +103,8 @@ async def content_process(state: SourceState) -> dict:
 async def save_source(state: SourceState) -> dict:
     content_state = state["content_state"]
 
-    # Get existing source using the provided source_id
-    source = await Source.get(state["source_id"])
+    # Reuse the source loaded by the caller; fall back to fetching it by id
+    source = state.get("source") or await Source.get(state["source_id"])
     if not source:
         raise ValueError(f"Source with ID {state['source_id']} not found")
 
@@ -117,8 +123,16 @@ async def save_source(state: SourceState) -> dict:
 
     if state["embed"]:
         if source.full_text and source.full_text.strip():
-            logger.debug("Embedding content for vector search")
-            await source.vectorize()
+            if source.chunk_count and source.embedded_hash == await embedding_hash(
+                source.full_text
+            ):
+                logger.debug(
+                    f"Source {source.id} content and embedding model unchanged "
+                    "since last embedding, skipping vectorization"
+                )
+            else:
+                logger.debug("Embedding content for vector search")
+                await source.vectorize()
         else:
             logger.warning(
                 f"Source {source.id} has no text content to embed, skipping vectorization"
@@ -183,5 +197,8 @@ workflow.add_conditional_edges(
 )
 workflow.add_edge("transform_content", END)
 
-# Compile the graph
-source_graph = workflow.compile()
+# Compile the graph. The Send fan-out already runs transform_content tasks
+# concurrently; cap it so a long transformation list can't burst the provider.
+source_graph = workflow.compile().with_config(
+    max_concurrency=MAX_CONCURRENT_TRANSFORMATIONS
+)
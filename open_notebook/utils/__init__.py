@@ -18,12 +18,14 @@ from .chunking import (
     detect_content_type_from_heuristics,
 )
 from .embedding import (
+    embedding_hash,
     generate_embedding,
     generate_embeddings,
     mean_pool_embeddings,
 )
 from .encryption import (
     decrypt_value,
+    decrypt_values,
     encrypt_value,
 )
 from .text_utils import (
@@ -31,6 +33,7 @@ from .text_utils import (
     parse_thinking_content,
     remove_non_ascii,
     remove_non_printable,
+    text_hash,
 )
 from .token_utils import token_cost, token_count
 from .version_utils import (
@@ -48,6 +51,7 @@ __all__ = [
     "detect_content_type_from_extension",
     "detect_content_type_from_heuristics",
     # Embedding
+    "embedding_hash",
     "generate_embedding",
     "generate_embeddings",
     "mean_pool_embeddings",
@@ -56,6 +60,7 @@ __all__ = [
     "remove_non_printable",
     "parse_thinking_content",
     "clean_thinking_content",
+    "text_hash",
     # Token utils
     "token_count",
     "token_cost",
@@ -65,5 +70,6 @@ __all__ = [
     "get_version_from_github",
     # Encryption utils
     "decrypt_value",
+    "decrypt_values",
     "encrypt_value",
 ]
@@ -0,0 +1,53 @@
+"""
+Run coroutines from synchronous code on a shared background event loop.
+
+LangGraph chat nodes and the sync migration wrapper need to call async
+domain code. Creating a new event loop per call also means a new database
+connection per call (connections are cached per loop), so instead every
+coroutine is submitted to one long-lived loop running in a daemon thread.
+"""
+
+import asyncio
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+
+T = TypeVar("T")
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Get the background loop, starting its thread on first use."""
+    global _loop
+    with _loop_lock:
+        if _loop is None or _loop.is_closed():
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever,
+                name="open-notebook-async-bridge",
+                daemon=True,
+            ).start()
+            _loop = loop
+        return _loop
+
+
+def run_sync(coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+    """
+    Run a coroutine on the background loop and block until it completes.
+
+    Safe to call from plain sync code and from sync code running inside
+    another event loop's thread (e.g. a LangGraph node invoked from FastAPI).
+
+    Raises:
+        RuntimeError: If called from the background loop itself (would deadlock).
+    """
+    loop = _get_background_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        coro.close()
+        raise RuntimeError("run_sync() cannot be called from the background loop")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result(timeout)
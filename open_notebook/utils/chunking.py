@@ -16,7 +16,6 @@ Environment Variables:
 import os
 import re
 from enum import Enum
-from pathlib import Path
 from typing import List, Optional, Tuple
 
 from langchain_text_splitters import (
@@ -154,7 +153,8 @@ def detect_content_type_from_extension(
         return None
 
     try:
-        extension = Path(file_path).suffix.lower()
+        # Plain string op: avoids building a Path object per call
+        extension = os.path.splitext(file_path)[1].lower()
         return _EXTENSION_TO_CONTENT_TYPE.get(extension)
     except Exception:
         return None
@@ -211,8 +211,9 @@ def _calculate_html_score(text: str) -> float:
 
     # Structural tags
     structural_tags = ["<head", "<body", "<div", "<span", "<p>", "<table", "<form"]
+    lowered = text.lower()
     for tag in structural_tags:
-        if tag.lower() in text.lower():
+        if tag in lowered:
             score += 0.1
             indicators += 1
             if indicators >= 5:
@@ -306,6 +307,11 @@ def detect_content_type(text: str, file_path: Optional[str] = None) -> ContentTy
     # Try extension-based detection first
     extension_type = detect_content_type_from_extension(file_path)
 
+    # A specific (non-plain) extension always wins, so skip the heuristics
+    if extension_type is not None and extension_type != ContentType.PLAIN:
+        logger.debug(f"Using extension-based content type: {extension_type.value}")
+        return extension_type
+
     # Get heuristic-based detection
     heuristic_type, confidence = detect_content_type_from_heuristics(text)
 
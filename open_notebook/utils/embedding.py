@@ -17,6 +17,7 @@ import numpy as np
 from loguru import logger
 
 from .chunking import CHUNK_SIZE, ContentType, chunk_text
+from .text_utils import text_hash
 
 EMBEDDING_BATCH_SIZE = 50
 EMBEDDING_MAX_RETRIES = 3
@@ -84,15 +85,32 @@ async def mean_pool_embeddings(embeddings: List[List[float]]) -> List[float]:
     return mean.tolist()
 
 
+async def embedding_hash(text: str) -> str:
+    """
+    Fingerprint text together with the current default embedding model.
+
+    Stored as Source.embedded_hash so re-processing can skip re-embedding
+    unchanged content, while a change of embedding model (which may also
+    change the vector dimensions) still forces a re-embed.
+    """
+    # Lazy import to avoid circular dependency
+    from open_notebook.ai.models import model_manager
+
+    defaults = await model_manager.get_defaults()
+    return text_hash(f"{defaults.default_embedding_model or ''}\n{text}")
+
+
 async def generate_embeddings(
     texts: List[str], command_id: Optional[str] = None
 ) -> List[List[float]]:
     """
     Generate embeddings for multiple texts with automatic batching and retry.
 
-    Texts are split into batches of EMBEDDING_BATCH_SIZE to avoid exceeding
-    provider payload limits. Each batch is retried up to EMBEDDING_MAX_RETRIES
-    times on transient failures.
+    Identical texts (repeated boilerplate chunks, for example) are embedded
+    once and the vector is reused for every occurrence. Unique texts are split
+    into batches of EMBEDDING_BATCH_SIZE to avoid exceeding provider payload
+    limits. Each batch is retried up to EMBEDDING_MAX_RETRIES times on
+    transient failures.
 
     Args:
         texts: List of text strings to embed
@@ -119,6 +137,14 @@ async def generate_embeddings(
 
     model_name = getattr(embedding_model, "model_name", "unknown")
 
+    # Embed each distinct text once; dict.fromkeys keeps first-seen order
+    unique_texts = list(dict.fromkeys(texts))
+    if len(unique_texts) < len(texts):
+        logger.debug(
+            f"Reusing embeddings for {len(texts) - len(unique_texts)} duplicate "
+            f"text(s) out of {len(texts)}"
+        )
+
     # Log text sizes for debugging
     text_sizes = [len(t) for t in texts]
     logger.debug(
@@ -128,12 +154,14 @@ async def generate_embeddings(
     )
 
     all_embeddings: List[List[float]] = []
-    total_batches = (len(texts) + EMBEDDING_BATCH_SIZE - 1) // EMBEDDING_BATCH_SIZE
+    total_batches = (
+        len(unique_texts) + EMBEDDING_BATCH_SIZE - 1
+    ) // EMBEDDING_BATCH_SIZE
 
     for batch_idx in range(total_batches):
         start = batch_idx * EMBEDDING_BATCH_SIZE
         end = start + EMBEDDING_BATCH_SIZE
-        batch = texts[start:end]
+        batch = unique_texts[start:end]
 
         for attempt in range(1, EMBEDDING_MAX_RETRIES + 1):
             try:
@@ -162,7 +190,11 @@ async def generate_embeddings(
                     ) from e
 
     logger.debug(f"Generated {len(all_embeddings)} embeddings in {total_batches} batch(es)")
-    return all_embeddings
+    if len(unique_texts) == len(texts) or len(all_embeddings) != len(unique_texts):
+        # Nothing to expand (or a provider count mismatch the caller will report)
+        return all_embeddings
+    by_text = dict(zip(unique_texts, all_embeddings))
+    return [by_text[text] for text in texts]
 
 
 async def generate_embedding(
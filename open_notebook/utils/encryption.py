@@ -17,10 +17,12 @@ Usage:
 """
 
 import base64
+import functools
 import hashlib
 import os
+import re
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 from cryptography.fernet import Fernet, InvalidToken
 from loguru import logger
@@ -112,6 +114,12 @@ def _ensure_fernet_key(key: str) -> str:
     return base64.urlsafe_b64encode(derived).decode()
 
 
+# Fernet instance built once from the derived key. Fernet already runs on
+# OpenSSL (AES-NI); the avoidable per-call cost is the SHA-256 key derivation
+# and cipher setup, not the cipher itself.
+_FERNET: Optional[Fernet] = None
+
+
 def get_fernet() -> Fernet:
     """
     Get Fernet instance with the configured encryption key.
@@ -122,7 +130,10 @@ def get_fernet() -> Fernet:
     Raises:
         ValueError: If encryption key is not configured.
     """
-    return Fernet(_ensure_fernet_key(_get_encryption_key()).encode())
+    global _FERNET
+    if _FERNET is None:
+        _FERNET = Fernet(_ensure_fernet_key(_get_encryption_key()).encode())
+    return _FERNET
 
 
 def encrypt_value(value: str) -> str:
@@ -142,6 +153,10 @@ def encrypt_value(value: str) -> str:
     return fernet.encrypt(value.encode()).decode()
 
 
+# Padded URL-safe base64, as produced by Fernet.encrypt()
+_FERNET_TOKEN_RE = re.compile(r"[A-Za-z0-9_-]+={0,2}")
+
+
 def looks_like_fernet_token(s: str) -> bool:
     """
     Check if string looks like a Fernet encrypted token.
@@ -149,19 +164,49 @@ def looks_like_fernet_token(s: str) -> bool:
     Fernet tokens are versioned (1 byte) + timestamp (8 bytes) + IV (16 bytes)
     + ciphertext (variable, multiple of 16 with PKCS7 padding) + HMAC (32 bytes).
     Minimum decoded size is 73 bytes (1+8+16+16+32) for the smallest payload.
+
+    The decoded size is derived from the base64 length and padding, so the
+    check never decodes or allocates.
     """
     if len(s) < 100:  # Base64 of 73 bytes = ~100 chars minimum
         return False
-    try:
-        decoded = base64.urlsafe_b64decode(s)
-        # Fernet: version(1) + timestamp(8) + IV(16) + ciphertext(>=16) + HMAC(32)
-        # Minimum 73 bytes, ciphertext must be multiple of 16 (AES block size)
-        if len(decoded) < 73:
-            return False
-        ciphertext_len = len(decoded) - 1 - 8 - 16 - 32
-        return ciphertext_len > 0 and ciphertext_len % 16 == 0
-    except Exception:
+    # Version byte 0x80 always encodes to a leading "g"
+    if s[0] != "g" or len(s) % 4 != 0:
+        return False
+    if not _FERNET_TOKEN_RE.fullmatch(s):
         return False
+    decoded_len = len(s) // 4 * 3 - (len(s) - len(s.rstrip("=")))
+    # Ciphertext must be a non-empty multiple of 16 (AES block size)
+    ciphertext_len = decoded_len - 1 - 8 - 16 - 32
+    return ciphertext_len > 0 and ciphertext_len % 16 == 0
+
+
+# Decrypted tokens keyed by (Fernet instance, token). Stored tokens never
+# change, and provider key lookups decrypt the same credentials repeatedly.
+# Failed decrypts raise, so they are never cached.
+@functools.lru_cache(maxsize=256)
+def _decrypt_token(fernet: Fernet, token: str) -> str:
+    return fernet.decrypt(token.encode()).decode()
+
+
+def _decrypt_with(fernet: Fernet, value: str) -> str:
+    """Decrypt one value with an existing Fernet instance (see decrypt_value)."""
+    # Not a valid token - treat as legacy plaintext without attempting the
+    # HMAC check and raising InvalidToken
+    if not looks_like_fernet_token(value):
+        return value
+
+    try:
+        return _decrypt_token(fernet, value)
+    except InvalidToken:
+        # Looks like encrypted data but failed to decrypt - likely wrong key
+        raise ValueError(
+            "Decryption failed: data appears to be encrypted but key is incorrect. "
+            "Check OPEN_NOTEBOOK_ENCRYPTION_KEY configuration."
+        )
+    except Exception as e:
+        logger.error(f"Decryption failed: {e}")
+        raise ValueError(f"Decryption failed: {str(e)}")
 
 
 def decrypt_value(value: str) -> str:
@@ -180,19 +225,27 @@ def decrypt_value(value: str) -> str:
         ValueError: If encryption is not configured or if decryption fails
             for what appears to be encrypted data (wrong key).
     """
-    fernet = get_fernet()
+    return _decrypt_with(get_fernet(), value)
 
-    try:
-        return fernet.decrypt(value.encode()).decode()
-    except InvalidToken:
-        if looks_like_fernet_token(value):
-            # Looks like encrypted data but failed to decrypt - likely wrong key
-            raise ValueError(
-                "Decryption failed: data appears to be encrypted but key is incorrect. "
-                "Check OPEN_NOTEBOOK_ENCRYPTION_KEY configuration."
-            )
-        # Not a valid token - treat as legacy plaintext
-        return value
-    except Exception as e:
-        logger.error(f"Decryption failed: {e}")
-        raise ValueError(f"Decryption failed: {str(e)}")
+
+def decrypt_values(values: List[str]) -> List[str]:
+    """
+    Decrypt a batch of values, e.g. the api_key column of a table scan.
+
+    Resolves the Fernet instance once for the whole batch, and only when some
+    value looks encrypted, so an empty batch or one holding only legacy
+    plaintext works without an encryption key.
+
+    Args:
+        values: Encrypted strings (or plain text for legacy data).
+
+    Returns:
+        Decrypted values in the same order.
+
+    Raises:
+        ValueError: Same conditions as decrypt_value, for any element.
+    """
+    if not any(looks_like_fernet_token(value) for value in values):
+        return list(values)
+    fernet = get_fernet()
+    return [_decrypt_with(fernet, value) for value in values]
@@ -3,6 +3,7 @@ Text utilities for Open Notebook.
 Extracted from main utils to avoid circular imports.
 """
 
+import hashlib
 import re
 import unicodedata
 from typing import Tuple
@@ -14,6 +15,11 @@ THINK_PATTERN = re.compile(r"<think>(.*?)</think>", re.DOTALL)
 THINK_PATTERN_NO_OPEN = re.compile(r"^(.*?)</think>", re.DOTALL)
 
 
+def text_hash(text: str) -> str:
+    """Return the SHA-256 hex digest of a text's UTF-8 encoding."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
 def remove_non_ascii(text: str) -> str:
     """Remove non-ASCII characters from text."""
     return re.sub(r"[^\x00-\x7F]+", "", text)
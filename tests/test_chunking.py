@@ -60,6 +60,14 @@ class TestDetectContentTypeFromExtension:
         assert detect_content_type_from_extension("Makefile") is None
         assert detect_content_type_from_extension("README") is None
 
+    def test_dotted_directory(self):
+        """Test that dots in directory names are not mistaken for extensions."""
+        assert detect_content_type_from_extension("/data/v1.2/README") is None
+        assert (
+            detect_content_type_from_extension("/data/v1.2/notes.MD")
+            == ContentType.MARKDOWN
+        )
+
     def test_none_input(self):
         """Test None input."""
         assert detect_content_type_from_extension(None) is None
@@ -12,12 +12,13 @@ from unittest.mock import AsyncMock, patch
 import pytest
 from pydantic import ValidationError
 
-from open_notebook.ai.models import ModelManager
+from open_notebook.ai.models import Model, ModelManager
 from open_notebook.domain.base import RecordModel
 from open_notebook.domain.content_settings import ContentSettings
-from open_notebook.domain.notebook import Asset, Note, Notebook, Source
+from open_notebook.domain.credential import Credential
+from open_notebook.domain.notebook import Asset, Note, Notebook, Source, SourceInsight
 from open_notebook.domain.transformation import Transformation
-from open_notebook.exceptions import InvalidInputError
+from open_notebook.exceptions import DatabaseOperationError, InvalidInputError
 from open_notebook.podcasts.models import EpisodeProfile, SpeakerProfile
 
 # ============================================================================
@@ -50,6 +51,34 @@ class TestRecordModelSingleton:
         # Cleanup
         TestRecord.clear_instance()
 
+    @pytest.mark.asyncio
+    async def test_update_uses_upsert_result(self):
+        """Test that update() refreshes from the UPSERT result in one round-trip."""
+
+        class TestRecord(RecordModel):
+            record_id = "test:update"
+            value: int = 0
+
+        TestRecord.clear_instance()
+        instance = TestRecord(value=1)
+
+        with (
+            patch(
+                "open_notebook.domain.base.repo_upsert",
+                new=AsyncMock(return_value=[{"id": "test:update", "value": 2}]),
+            ) as mock_upsert,
+            patch(
+                "open_notebook.domain.base.repo_query", new=AsyncMock()
+            ) as mock_query,
+        ):
+            await instance.update()
+
+        mock_upsert.assert_awaited_once()
+        mock_query.assert_not_awaited()
+        assert instance.value == 2
+
+        TestRecord.clear_instance()
+
 
 # ============================================================================
 # TEST SUITE 2: ModelManager Instance Isolation
@@ -68,6 +97,38 @@ class TestModelManager:
         assert manager1 is not manager2
         assert id(manager1) != id(manager2)
 
+    @pytest.mark.asyncio
+    async def test_model_get_is_cached_and_invalidated_on_save(self):
+        """Test that Model.get() hits the DB once until the model is saved."""
+        Model.invalidate_cache()
+        row = {
+            "id": "model:abc",
+            "name": "gpt-4",
+            "provider": "openai",
+            "type": "language",
+        }
+        with patch(
+            "open_notebook.domain.base.repo_query",
+            new_callable=AsyncMock,
+            return_value=[row],
+        ) as mock_query:
+            first = await Model.get("model:abc")
+            second = await Model.get("model:abc")
+            assert mock_query.call_count == 1
+            assert first is not second
+
+            with patch(
+                "open_notebook.domain.base.repo_update",
+                new_callable=AsyncMock,
+                return_value=[row],
+            ):
+                await second.save()
+
+            await Model.get("model:abc")
+            assert mock_query.call_count == 2
+
+        Model.invalidate_cache()
+
 
 # ============================================================================
 # TEST SUITE 3: Notebook Domain Logic
@@ -201,6 +262,29 @@ class TestSourceDomain:
             assert result is True
             mock_delete.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_get_embedded_chunks_uses_cached_count(self):
+        """Test that a cached chunk_count skips the count query and is never saved."""
+        source = Source(id="source:test_cached", title="Test", chunk_count=7)
+        with patch(
+            "open_notebook.domain.notebook.repo_query", new_callable=AsyncMock
+        ) as mock_query:
+            assert await source.get_embedded_chunks() == 7
+            mock_query.assert_not_called()
+
+        assert "chunk_count" not in source._prepare_save_data()
+
+    @pytest.mark.asyncio
+    async def test_get_embedded_chunks_falls_back_to_count(self):
+        """Test that sources without a cached count still query source_embedding."""
+        source = Source(id="source:test_legacy", title="Test")
+        with patch(
+            "open_notebook.domain.notebook.repo_query",
+            new_callable=AsyncMock,
+            return_value=[{"chunks": 3}],
+        ) as mock_query:
+            assert await source.get_embedded_chunks() == 3
+            mock_query.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_vectorize_raises_valueerror_when_no_text(self):
@@ -238,6 +322,123 @@ class TestSourceDomain:
             )
             assert result == "command:123"
 
+    @pytest.mark.asyncio
+    async def test_insight_save_as_note_requires_insight(self):
+        """Test that save_as_note() raises when the insight row is missing."""
+        insight = SourceInsight(
+            id="source_insight:1", insight_type="Summary", content="Text"
+        )
+        with (
+            patch(
+                "open_notebook.domain.notebook.repo_query",
+                new_callable=AsyncMock,
+                return_value=[],
+            ),
+            patch.object(Note, "save", new_callable=AsyncMock) as mock_save,
+        ):
+            with pytest.raises(DatabaseOperationError):
+                await insight.save_as_note()
+            mock_save.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "title,expected",
+        [
+            ("Paper", "Summary from source Paper"),
+            (None, "Summary from source Untitled Source"),
+        ],
+    )
+    async def test_insight_save_as_note_title(self, title, expected):
+        """Test that save_as_note() saves a note even for untitled sources."""
+        insight = SourceInsight(
+            id="source_insight:1", insight_type="Summary", content="Text"
+        )
+        with (
+            patch(
+                "open_notebook.domain.notebook.repo_query",
+                new_callable=AsyncMock,
+                return_value=[{"title": title}],
+            ),
+            patch.object(Note, "save", new_callable=AsyncMock) as mock_save,
+        ):
+            note = await insight.save_as_note()
+            mock_save.assert_awaited_once()
+            assert note.title == expected
+            assert note.content == "Text"
+
+
+# ============================================================================
+# TEST SUITE 4b: Credential Domain
+# ============================================================================
+
+
+class TestCredentialDomain:
+    """Test suite for Credential caching and batch lookups."""
+
+    @pytest.mark.asyncio
+    async def test_get_is_cached_and_invalidated_on_delete(self):
+        """Test that repeated get() calls hit the DB once until the entry is dropped."""
+        Credential.invalidate_cache()
+        row = {"id": "credential:abc", "name": "Main", "provider": "openai"}
+        with patch(
+            "open_notebook.domain.base.repo_query",
+            new_callable=AsyncMock,
+            return_value=[row],
+        ) as mock_query:
+            first = await Credential.get("credential:abc")
+            second = await Credential.get("credential:abc")
+            assert mock_query.call_count == 1
+            assert first is not second
+            assert second.name == "Main"
+
+            with patch(
+                "open_notebook.domain.base.repo_delete",
+                new_callable=AsyncMock,
+                return_value=True,
+            ):
+                await second.delete()
+
+            await Credential.get("credential:abc")
+            assert mock_query.call_count == 2
+
+        Credential.invalidate_cache()
+
+    @pytest.mark.asyncio
+    async def test_get_all_without_encryption_key(self, monkeypatch):
+        """Test that listing keyless credentials works with no key configured."""
+        from open_notebook.utils import encryption
+
+        monkeypatch.delenv("OPEN_NOTEBOOK_ENCRYPTION_KEY", raising=False)
+        monkeypatch.setattr(encryption, "_ENCRYPTION_KEY", None)
+        monkeypatch.setattr(encryption, "_FERNET", None)
+        rows = [{"id": "credential:local", "name": "Local", "provider": "ollama"}]
+        with patch(
+            "open_notebook.domain.base.repo_query",
+            new_callable=AsyncMock,
+            side_effect=[[], rows],
+        ):
+            assert await Credential.get_all() == []
+            credentials = await Credential.get_all()
+
+        assert [c.name for c in credentials] == ["Local"]
+        assert encryption._FERNET is None
+
+    @pytest.mark.asyncio
+    async def test_linked_model_counts_single_query(self):
+        """Test that linked model counts for many credentials use one query."""
+        with patch(
+            "open_notebook.domain.credential.repo_query",
+            new_callable=AsyncMock,
+            return_value=[{"credential": "credential:a", "count": 2}],
+        ) as mock_query:
+            counts = await Credential.get_linked_model_counts(
+                ["credential:a", "credential:b"]
+            )
+            mock_query.assert_called_once()
+            assert counts == {"credential:a": 2}
+
+        assert await Credential.get_linked_model_counts([]) == {}
+
 
 # ============================================================================
 # TEST SUITE 5: Note Domain
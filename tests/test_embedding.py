@@ -143,6 +143,23 @@ class TestGenerateEmbeddings:
             assert result[1] == [0.4, 0.5, 0.6]
             mock_model.aembed.assert_called_once_with(["text1", "text2"])
 
+    @pytest.mark.asyncio
+    async def test_duplicate_texts_embedded_once(self):
+        """Test that repeated texts share one embedding call and vector."""
+        from unittest.mock import AsyncMock, MagicMock, patch
+
+        mock_model = MagicMock()
+        mock_model.aembed = AsyncMock(return_value=[[0.1, 0.2], [0.3, 0.4]])
+
+        with patch(
+            "open_notebook.ai.models.model_manager.get_embedding_model",
+            new_callable=AsyncMock,
+            return_value=mock_model,
+        ):
+            result = await generate_embeddings(["a", "b", "a"])
+            assert result == [[0.1, 0.2], [0.3, 0.4], [0.1, 0.2]]
+            mock_model.aembed.assert_called_once_with(["a", "b"])
+
 
 # ============================================================================
 # TEST SUITE 3: Generate Single Embedding (requires mocking)
@@ -151,5 +151,120 @@ class TestTransformationGraph:
         assert hasattr(transformation_graph, "ainvoke")
 
 
+# ============================================================================
+# TEST SUITE 4: Source Graph
+# ============================================================================
+
+
+class TestSourceGraph:
+    """Test suite for source ingestion graph nodes."""
+
+    @staticmethod
+    def _state(text):
+        from unittest.mock import MagicMock
+
+        content_state = MagicMock(url=None, file_path=None, content=text, title=None)
+        return {"content_state": content_state, "source_id": "source:1", "embed": True}
+
+    async def _save_with_embedded(self, embedded_text, embedded_model, text, model):
+        """Run save_source on a source embedded earlier; return the vectorize mock."""
+        from unittest.mock import AsyncMock, MagicMock, patch
+
+        from open_notebook.domain.notebook import Source
+        from open_notebook.graphs.source import save_source
+        from open_notebook.utils import text_hash
+
+        source = Source(
+            id="source:1",
+            full_text=embedded_text,
+            chunk_count=1,
+            embedded_hash=text_hash(f"{embedded_model}\n{embedded_text}"),
+        )
+        defaults = MagicMock(default_embedding_model=model)
+        with (
+            patch(
+                "open_notebook.ai.models.model_manager.get_defaults",
+                new=AsyncMock(return_value=defaults),
+            ),
+            patch.object(Source, "get", new=AsyncMock(return_value=source)),
+            patch.object(Source, "save", new=AsyncMock()),
+            patch.object(Source, "vectorize", new=AsyncMock()) as mock_vectorize,
+        ):
+            await save_source(self._state(text))
+        return mock_vectorize
+
+    @pytest.mark.asyncio
+    async def test_save_source_skips_unchanged_embedding(self):
+        """Test that unchanged content is not re-embedded."""
+        mock_vectorize = await self._save_with_embedded(
+            "same", "model:emb", "same", "model:emb"
+        )
+        mock_vectorize.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_save_source_embeds_changed_content(self):
+        """Test that changed content is re-embedded."""
+        mock_vectorize = await self._save_with_embedded(
+            "old", "model:emb", "new", "model:emb"
+        )
+        mock_vectorize.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_save_source_embeds_after_model_change(self):
+        """Test that switching the embedding model forces a re-embed."""
+        mock_vectorize = await self._save_with_embedded(
+            "same", "model:old", "same", "model:new"
+        )
+        mock_vectorize.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_save_source_reuses_source_from_state(self):
+        """Test that a source passed in the state is not fetched again."""
+        from unittest.mock import AsyncMock, patch
+
+        from open_notebook.domain.notebook import Source
+        from open_notebook.graphs.source import save_source
+
+        source = Source(id="source:1", full_text="old")
+        state = {**self._state("new"), "source": source, "embed": False}
+        with (
+            patch.object(Source, "get", new=AsyncMock()) as mock_get,
+            patch.object(Source, "save", new=AsyncMock()),
+        ):
+            result = await save_source(state)
+
+        mock_get.assert_not_awaited()
+        assert result["source"] is source
+        assert source.full_text == "new"
+
+    @pytest.mark.asyncio
+    async def test_stt_config_is_cached(self, monkeypatch):
+        """Test that the speech-to-text lookup is reused within the TTL."""
+        from unittest.mock import AsyncMock, MagicMock, patch
+
+        from open_notebook.graphs import source as source_graph_module
+
+        monkeypatch.setattr(source_graph_module, "_stt_config_cache", None)
+        defaults = MagicMock(default_speech_to_text_model="model:stt")
+        stt_model = MagicMock(provider="openai")
+        stt_model.name = "whisper-1"
+
+        with (
+            patch.object(
+                source_graph_module.model_manager,
+                "get_defaults",
+                new=AsyncMock(return_value=defaults),
+            ) as mock_defaults,
+            patch.object(
+                source_graph_module.Model, "get", new=AsyncMock(return_value=stt_model)
+            ),
+        ):
+            first = await source_graph_module._get_stt_config()
+            second = await source_graph_module._get_stt_config()
+
+        assert first == second == ("openai", "whisper-1")
+        mock_defaults.assert_awaited_once()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,108 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from open_notebook.database import repository
+
+
+def _fake_connection(alive=True):
+    db = AsyncMock()
+    db.recv_task = MagicMock()
+    db.recv_task.done.return_value = not alive
+    return db
+
+
+class TestConnectionReuse:
+    """Test suite for the per-loop shared database connection."""
+
+    @staticmethod
+    async def _use_connection():
+        async with repository.db_connection() as db:
+            return db
+
+    def test_short_lived_loops_close_their_connection(self):
+        """Test that asyncio.run() closes and forgets the loop's connection."""
+        opened = []
+
+        async def fake_open():
+            db = _fake_connection()
+            opened.append(db)
+            return db
+
+        with patch.object(repository, "_open_connection", new=fake_open):
+            for _ in range(5):
+                asyncio.run(self._use_connection())
+
+        assert len(opened) == 5
+        for db in opened:
+            db.close.assert_awaited_once()
+        assert repository._connections == {}
+        assert repository._loop_state == {}
+
+    def test_cancelled_caller_keeps_shared_connection(self):
+        """Test that cancelling one query does not close the loop's connection."""
+        db = _fake_connection()
+
+        async def scenario():
+            started = asyncio.Event()
+
+            async def slow_query():
+                async with repository.db_connection():
+                    started.set()
+                    await asyncio.sleep(10)
+
+            task = asyncio.create_task(slow_query())
+            await started.wait()
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+            assert await self._use_connection() is db
+            db.close.assert_not_awaited()
+
+        with patch.object(
+            repository, "_open_connection", new=AsyncMock(return_value=db)
+        ):
+            asyncio.run(scenario())
+
+        db.close.assert_awaited_once()
+
+    def test_transport_error_discards_connection(self):
+        """Test that a dropped socket makes the next call reconnect."""
+        first, second = _fake_connection(), _fake_connection()
+
+        async def scenario():
+            with pytest.raises(OSError):
+                async with repository.db_connection():
+                    raise OSError("connection reset")
+            first.close.assert_awaited_once()
+            assert await self._use_connection() is second
+
+        with patch.object(
+            repository,
+            "_open_connection",
+            new=AsyncMock(side_effect=[first, second]),
+        ):
+            asyncio.run(scenario())
+
+    def test_dead_connection_is_replaced(self):
+        """Test that a connection whose receive task exited is not reused."""
+        first, second = _fake_connection(), _fake_connection()
+
+        async def scenario():
+            assert await self._use_connection() is first
+            # Server restart: the receive loop ends but the socket is kept
+            first.recv_task.done.return_value = True
+            assert await self._use_connection() is second
+            first.close.assert_awaited_once()
+            assert await self._use_connection() is second
+
+        with patch.object(
+            repository,
+            "_open_connection",
+            new=AsyncMock(side_effect=[first, second]),
+        ):
+            asyncio.run(scenario())
+
+        second.close.assert_awaited_once()
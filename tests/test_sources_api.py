@@ -0,0 +1,68 @@
+import tempfile
+
+import pytest
+
+
+class TestUploadCopy:
+    """Test suite for copying uploaded files to disk."""
+
+    @pytest.mark.parametrize("rolled", [False, True])
+    def test_copy_upload_to_disk(self, tmp_path, rolled):
+        """Test that in-memory and rolled-over uploads are copied intact."""
+        from api.routers.sources import _copy_upload_to_disk
+
+        data = bytes(range(256)) * 4096
+        with tempfile.SpooledTemporaryFile(max_size=1024) as upload:
+            upload.write(data if rolled else data[:512])
+            upload.seek(0)
+            assert upload._rolled is rolled
+
+            target = tmp_path / "upload.bin"
+            _copy_upload_to_disk(upload, str(target))
+
+        assert target.read_bytes() == (data if rolled else data[:512])
+
+    def test_upload_dir_created_once(self, tmp_path):
+        """Test that the upload folder is created on first use and then reused."""
+        from unittest.mock import patch
+
+        from api.routers.sources import _ensure_upload_dir, generate_unique_filename
+
+        _ensure_upload_dir.cache_clear()
+        folder = tmp_path / "uploads"
+        first = generate_unique_filename("a.pdf", str(folder))
+        assert folder.is_dir()
+        (folder / "a.pdf").touch()
+
+        with patch("pathlib.Path.mkdir") as mock_mkdir:
+            second = generate_unique_filename("a.pdf", str(folder))
+        mock_mkdir.assert_not_called()
+        assert first == str(folder / "a.pdf")
+        assert second == str(folder / "a (1).pdf")
+        _ensure_upload_dir.cache_clear()
+
+    @pytest.mark.asyncio
+    async def test_save_recreates_deleted_upload_dir(self, tmp_path):
+        """Test that uploads still work after the cached upload folder is removed."""
+        import io
+        from unittest.mock import patch
+
+        from fastapi import UploadFile
+
+        from api.routers.sources import _ensure_upload_dir, save_uploaded_file
+
+        _ensure_upload_dir.cache_clear()
+        folder = tmp_path / "uploads"
+        with patch("api.routers.sources.UPLOADS_FOLDER", str(folder)):
+            await save_uploaded_file(UploadFile(io.BytesIO(b"first"), filename="a.txt"))
+            for child in folder.iterdir():
+                child.unlink()
+            folder.rmdir()
+
+            path = await save_uploaded_file(
+                UploadFile(io.BytesIO(b"second"), filename="b.txt")
+            )
+
+        assert path == str(folder / "b.txt")
+        assert (folder / "b.txt").read_bytes() == b"second"
+        _ensure_upload_dir.cache_clear()
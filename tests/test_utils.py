@@ -10,12 +10,14 @@ import pytest
 from open_notebook.utils import (
     clean_thinking_content,
     compare_versions,
+    encryption,
     get_installed_version,
     parse_thinking_content,
     remove_non_ascii,
     remove_non_printable,
     token_count,
 )
+from open_notebook.utils.async_utils import run_sync
 from open_notebook.utils.context_builder import ContextBuilder, ContextConfig
 
 # ============================================================================
@@ -258,5 +260,117 @@ class TestContextBuilder:
         assert builder.include_insights is False
 
 
+# ============================================================================
+# TEST SUITE 5: Encryption
+# ============================================================================
+
+
+class TestEncryption:
+    """Test suite for field-level encryption helpers."""
+
+    @pytest.fixture(autouse=True)
+    def encryption_key(self, monkeypatch):
+        monkeypatch.setenv("OPEN_NOTEBOOK_ENCRYPTION_KEY", "test-passphrase")
+        monkeypatch.setattr(encryption, "_ENCRYPTION_KEY", None)
+        monkeypatch.setattr(encryption, "_FERNET", None)
+        encryption._decrypt_token.cache_clear()
+
+    def test_round_trip(self):
+        """Test that encrypted values decrypt back to the original."""
+        token = encryption.encrypt_value("sk-secret")
+        assert token != "sk-secret"
+        assert encryption.decrypt_value(token) == "sk-secret"
+
+    def test_legacy_plaintext_passthrough(self):
+        """Test that unencrypted legacy values are returned unchanged."""
+        assert encryption.decrypt_value("sk-plain") == "sk-plain"
+
+    def test_token_shape_detection(self):
+        """Test that real tokens of every padding length are recognised."""
+        for length in range(0, 48):
+            token = encryption.encrypt_value("x" * length)
+            assert token.startswith("gAAAAA")
+            assert encryption.looks_like_fernet_token(token)
+            assert not encryption.looks_like_fernet_token(token[:-4])
+            assert not encryption.looks_like_fernet_token(token[:-1] + " ")
+
+    def test_wrong_key_raises(self, monkeypatch):
+        """Test that a token encrypted under another key is not passed through."""
+        token = encryption.encrypt_value("sk-secret")
+        monkeypatch.setenv("OPEN_NOTEBOOK_ENCRYPTION_KEY", "other-passphrase")
+        monkeypatch.setattr(encryption, "_ENCRYPTION_KEY", None)
+        monkeypatch.setattr(encryption, "_FERNET", None)
+        with pytest.raises(ValueError, match="key is incorrect"):
+            encryption.decrypt_value(token)
+
+    def test_plaintext_skips_decrypt(self):
+        """Test that non-token values never reach Fernet.decrypt."""
+        from unittest.mock import patch
+
+        with patch.object(encryption.Fernet, "decrypt") as mock_decrypt:
+            assert encryption.decrypt_value("x" * 120) == "x" * 120
+        mock_decrypt.assert_not_called()
+
+    def test_decrypt_values_batch(self):
+        """Test batch decryption with mixed encrypted and legacy values."""
+        token = encryption.encrypt_value("sk-secret")
+        assert encryption.decrypt_values([token, "sk-plain"]) == [
+            "sk-secret",
+            "sk-plain",
+        ]
+
+    def test_decrypt_values_without_key(self, monkeypatch):
+        """Test that empty or plaintext-only batches need no encryption key."""
+        monkeypatch.setattr(encryption, "get_fernet", lambda: pytest.fail("no key"))
+        assert encryption.decrypt_values([]) == []
+        assert encryption.decrypt_values(["sk-plain"]) == ["sk-plain"]
+
+    def test_repeated_decrypt_is_cached(self):
+        """Test that decrypting the same token twice only runs Fernet once."""
+        token = encryption.encrypt_value("sk-secret")
+        assert encryption.decrypt_value(token) == "sk-secret"
+        assert encryption.decrypt_value(token) == "sk-secret"
+        assert encryption._decrypt_token.cache_info().hits == 1
+
+    def test_fernet_instance_is_reused(self):
+        """Test that the Fernet instance is built once, not per call."""
+        assert encryption.get_fernet() is encryption.get_fernet()
+
+
+# ============================================================================
+# TEST SUITE 6: Async Utilities
+# ============================================================================
+
+
+class TestAsyncUtilities:
+    """Test suite for running coroutines from sync code."""
+
+    def test_run_sync_returns_result(self):
+        """Test that run_sync returns the coroutine's result."""
+
+        async def add(a, b):
+            return a + b
+
+        assert run_sync(add(1, 2)) == 3
+
+    def test_run_sync_reuses_loop(self):
+        """Test that consecutive calls share one event loop."""
+        import asyncio
+
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        assert run_sync(current_loop()) is run_sync(current_loop())
+
+    @pytest.mark.asyncio
+    async def test_run_sync_from_running_loop(self):
+        """Test that run_sync works from sync code inside another loop."""
+
+        async def value():
+            return "ok"
+
+        assert run_sync(value()) == "ok"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])